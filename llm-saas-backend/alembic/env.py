@@ -46,10 +46,16 @@ def do_run_migrations(connection):
 
 
 async def run_async_migrations() -> None:
+    connect_args = {}
+    if settings.USE_PGBOUNCER:
+        # Transaction pooling cannot carry asyncpg prepared statements
+        from app.db.session import PGBOUNCER_CONNECT_ARGS
+        connect_args = PGBOUNCER_CONNECT_ARGS
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=connect_args,
     )
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
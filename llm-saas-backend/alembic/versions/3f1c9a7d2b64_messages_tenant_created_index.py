@@ -0,0 +1,35 @@
+"""messages_tenant_created_index
+
+Revision ID: 3f1c9a7d2b64
+Revises: 96981ee36384
+Create Date: 2026-10-15 10:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b64'
+down_revision: Union[str, None] = '96981ee36384'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index backs WHERE tenant_id = ? ORDER BY created_at DESC LIMIT n
+    # and makes the single-column tenant_id index redundant.
+    op.create_index(
+        'ix_messages_tenant_created',
+        'messages',
+        ['tenant_id', sa.text('created_at DESC')],
+        unique=False,
+    )
+    op.drop_index(op.f('ix_messages_tenant_id'), table_name='messages')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_messages_tenant_id'), 'messages', ['tenant_id'], unique=False)
+    op.drop_index('ix_messages_tenant_created', table_name='messages')
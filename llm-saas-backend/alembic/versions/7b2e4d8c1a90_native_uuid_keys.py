@@ -0,0 +1,76 @@
+"""native_uuid_keys
+
+Revision ID: 7b2e4d8c1a90
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-15 11:02:17.904311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4d8c1a90'
+down_revision: Union[str, None] = '3f1c9a7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs converted between VARCHAR(36) and native UUID.
+# Parents come before children so FK targets are converted first.
+_COLUMNS = [
+    ('tenants', 'id'),
+    ('users', 'id'),
+    ('users', 'tenant_id'),
+    ('messages', 'id'),
+    ('messages', 'user_id'),
+    ('messages', 'tenant_id'),
+]
+
+# (name, source table, source column, referent table)
+_FOREIGN_KEYS = [
+    ('users_tenant_id_fkey', 'users', 'tenant_id', 'tenants'),
+    ('messages_tenant_id_fkey', 'messages', 'tenant_id', 'tenants'),
+    ('messages_user_id_fkey', 'messages', 'user_id', 'users'),
+]
+
+
+def _drop_foreign_keys() -> None:
+    for name, table, _, _ in _FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+
+
+def _create_foreign_keys() -> None:
+    for name, table, column, referent in _FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referent, [column], ['id'], ondelete='CASCADE')
+
+
+def upgrade() -> None:
+    # Existing uuid4 strings are cast in place; new rows get UUIDv7 from the app.
+    _drop_foreign_keys()
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=36),
+            type_=postgresql.UUID(as_uuid=True),
+            postgresql_using=f'{column}::uuid',
+            existing_nullable=False,
+        )
+    _create_foreign_keys()
+
+
+def downgrade() -> None:
+    _drop_foreign_keys()
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.UUID(as_uuid=True),
+            type_=sa.String(length=36),
+            postgresql_using=f'{column}::varchar(36)',
+            existing_nullable=False,
+        )
+    _create_foreign_keys()
@@ -0,0 +1,34 @@
+"""users_email_lower_index
+
+Revision ID: c5a81f3e9d27
+Revises: 7b2e4d8c1a90
+Create Date: 2026-10-15 11:40:52.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a81f3e9d27'
+down_revision: Union[str, None] = '7b2e4d8c1a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bring legacy rows in line with the schema-level normalisation so plain
+    # equality lookups on ix_users_email match them.
+    op.execute("UPDATE users SET email = lower(btrim(email)) WHERE email <> lower(btrim(email))")
+    op.create_index(
+        'ix_users_email_lower',
+        'users',
+        [sa.text('lower(email)')],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_lower', table_name='users')
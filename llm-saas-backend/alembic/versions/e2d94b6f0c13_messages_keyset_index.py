@@ -0,0 +1,40 @@
+"""messages_keyset_index
+
+Revision ID: e2d94b6f0c13
+Revises: c5a81f3e9d27
+Create Date: 2026-10-15 13:20:08.446912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2d94b6f0c13'
+down_revision: Union[str, None] = 'c5a81f3e9d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # id is the tie-breaker of the (created_at, id) keyset cursor; with it in
+    # the index the row-value comparison and ORDER BY stay a range scan.
+    op.create_index(
+        'ix_messages_tenant_created_id',
+        'messages',
+        ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.drop_index('ix_messages_tenant_created', table_name='messages')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_messages_tenant_created',
+        'messages',
+        ['tenant_id', sa.text('created_at DESC')],
+        unique=False,
+    )
+    op.drop_index('ix_messages_tenant_created_id', table_name='messages')
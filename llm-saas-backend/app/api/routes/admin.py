@@ -11,13 +11,13 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import ORJSONRoute
 from app.db.session import get_db
 from app.dependencies import get_current_admin
-from app.models.user import User
-from app.schemas.user import UserCreate, UserRead
+from app.schemas.user import CurrentUser, UserCreate, UserRead
 from app.services.user_service import UserService
 
-router = APIRouter(prefix="/admin", tags=["Admin"])
+router = APIRouter(prefix="/admin", tags=["Admin"], route_class=ORJSONRoute)
 
 
 @router.post(
@@ -29,7 +29,7 @@ router = APIRouter(prefix="/admin", tags=["Admin"])
 async def admin_create_user(
     body: UserCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    admin: Annotated[User, Depends(get_current_admin)],
+    admin: Annotated[CurrentUser, Depends(get_current_admin)],
 ) -> UserRead:
     """
     Allows an admin to create users (including other admins) within
@@ -42,6 +42,6 @@ async def admin_create_user(
             data=body,
             tenant_id=admin.tenant_id,
         )
-        return UserRead.model_validate(user)
+        return UserRead.from_orm_fast(user)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
@@ -16,20 +16,33 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import ORJSONRoute
 from app.core.config import settings
 from app.core.security import create_access_token
 from app.db.session import get_db
 from app.dependencies import get_current_user
-from app.models.user import User
 from app.schemas.user import (
+    CurrentUser,
     TokenResponse,
     UserRead,
     UserRegister,
+    normalize_email,
 )
-from app.services.tenant_service import TenantService
-from app.services.user_service import UserService
+from app.services.user_service import TenantNotFoundError, UserService
 
-router = APIRouter(tags=["Authentication"])
+router = APIRouter(tags=["Authentication"], route_class=ORJSONRoute)
+
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+
+def _invalid_login() -> HTTPException:
+    # Fresh instance per raise: re-raising a shared exception grows its
+    # __traceback__ and pins every frame's locals (including form_data)
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid email or password",
+        headers=_BEARER_CHALLENGE,
+    )
 
 
 @router.post(
@@ -47,15 +60,11 @@ async def register(
     The tenant_id must correspond to an existing tenant.
     Default role is 'user'.
     """
-    tenant = await TenantService.get_tenant_by_id(db, body.tenant_id)
-    if tenant is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Tenant '{body.tenant_id}' not found",
-        )
     try:
         user = await UserService.register_user(db, body)
-        return UserRead.model_validate(user)
+        return UserRead.from_orm_fast(user)
+    except TenantNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
 
@@ -79,19 +88,18 @@ async def login(
     Via curl/Postman: send as form data (not JSON):
         -d "username=you@email.com&password=yourpassword"
     """
-    # form_data.username holds the email (OAuth2 spec uses "username")
-    user = await UserService.authenticate(db, form_data.username, form_data.password)
+    # form_data.username holds the email (OAuth2 spec uses "username");
+    # form fields bypass the schema, so normalise it here.
+    user = await UserService.authenticate(
+        db, normalize_email(form_data.username), form_data.password
+    )
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _invalid_login()
 
     expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     token = create_access_token(
-        subject=user.id,
-        tenant_id=user.tenant_id,
+        subject=str(user.id),
+        tenant_id=str(user.tenant_id),
         role=user.role,
         expires_delta=expires,
     )
@@ -100,7 +108,7 @@ async def login(
         access_token=token,
         token_type="bearer",
         expires_in=int(expires.total_seconds()),
-        user=UserRead.model_validate(user),
+        user=UserRead.from_orm_fast(user),
     )
 
 
@@ -110,6 +118,6 @@ async def login(
     summary="Get the currently authenticated user",
 )
 async def get_me(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ) -> UserRead:
-    return UserRead.model_validate(current_user)
\ No newline at end of file
+    return UserRead.from_orm_fast(current_user)
\ No newline at end of file
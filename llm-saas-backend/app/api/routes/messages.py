@@ -8,20 +8,66 @@ GET  /messages         — Paginated list of tenant messages
 GET  /messages/stream  — Stream LLM response token by token (SSE)
 """
 
-from typing import Annotated
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Annotated, AsyncGenerator, AsyncIterator
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import ORJSONRoute, ORJSONUTCResponse
 from app.db.session import get_db
 from app.dependencies import get_current_user
-from app.models.user import User
 from app.schemas.message import MessageCreate, MessageListResponse, MessageRead
-from app.services.llm_service import llm_service
+from app.schemas.user import CurrentUser
+from app.services.llm_service import get_llm_service
 from app.services.message_service import MessageService
 
-router = APIRouter(tags=["Messages"])
+router = APIRouter(tags=["Messages"], route_class=ORJSONRoute)
+
+# Max SSE frames buffered between the LLM producer and a slow client
+_STREAM_QUEUE_SIZE = 64
+_STREAM_END = object()
+
+
+async def _bounded_stream(
+    request: Request,
+    source: AsyncIterator[bytes],
+) -> AsyncGenerator[bytes, None]:
+    """
+    Relay `source` through a bounded queue.
+
+    The producer blocks once the queue is full, so a slow reader applies
+    backpressure to the LLM instead of buffering tokens without limit.
+    If the client disconnects, the producer is cancelled so no further
+    tokens are generated (or paid for).
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+
+    async def pump() -> None:
+        try:
+            async for frame in source:
+                await queue.put(frame)
+        except Exception as exc:
+            await queue.put(exc)
+        else:
+            await queue.put(_STREAM_END)
+
+    producer = asyncio.create_task(pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            if await request.is_disconnected():
+                break
+            yield item
+    finally:
+        producer.cancel()
 
 
 @router.post(
@@ -33,7 +79,7 @@ router = APIRouter(tags=["Messages"])
 async def send_message(
     body: MessageCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ) -> MessageRead:
     """
     Send a prompt to the LLM and receive the complete response.
@@ -45,7 +91,7 @@ async def send_message(
             content=body.content,
             user=current_user,
         )
-        return MessageRead.model_validate(message)
+        return MessageRead.from_orm_fast(message)
     except RuntimeError as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -59,9 +105,10 @@ async def send_message(
     response_class=StreamingResponse,
 )
 async def stream_message(
+    request: Request,
     content: str = Query(..., min_length=1, max_length=8000,
                          description="Prompt to send to the LLM"),
-    current_user: Annotated[User, Depends(get_current_user)] = None,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)] = None,
 ):
     """
     Stream the LLM response as Server-Sent Events (SSE).
@@ -84,10 +131,13 @@ async def stream_message(
           Use POST /messages for persistent storage.
     """
     return StreamingResponse(
-        llm_service.generate_stream(
-            prompt=content,
-            tenant_id=current_user.tenant_id,
-            user_id=current_user.id,
+        _bounded_stream(
+            request,
+            get_llm_service().generate_stream(
+                prompt=content,
+                tenant_id=str(current_user.tenant_id),
+                user_id=str(current_user.id),
+            ),
         ),
         media_type="text/event-stream",
         headers={
@@ -95,29 +145,50 @@ async def stream_message(
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
             "Connection": "keep-alive",
+            # GZipMiddleware passes through responses that already declare
+            # an encoding, so tokens are flushed as they arrive
+            "Content-Encoding": "identity",
         },
     )
 
 
 @router.get(
     "/messages",
-    response_model=MessageListResponse,
+    # Hot path: skip response_model re-validation; the schema still
+    # documents the shape in OpenAPI
+    response_model=None,
+    response_class=ORJSONUTCResponse,
+    responses={200: {"model": MessageListResponse}},
     summary="List messages for the current tenant (paginated)",
 )
 async def list_messages(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     skip: int = Query(default=0, ge=0, description="Pagination offset"),
     limit: int = Query(default=20, ge=1, le=100, description="Results per page"),
-) -> MessageListResponse:
+    before: datetime | None = Query(
+        default=None,
+        description="Cursor: created_at of the last item seen (with before_id). "
+                    "Faster than skip for deep pages; total is omitted.",
+    ),
+    before_id: uuid.UUID | None = Query(
+        default=None,
+        description="Cursor: id of the last item seen (with before).",
+    ),
+) -> ORJSONUTCResponse:
     """Paginated list of all messages in the authenticated user's tenant."""
+    if (before is None) != (before_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="before and before_id must be given together",
+        )
     total, messages = await MessageService.list_messages(
         db=db,
         user=current_user,
         skip=skip,
         limit=limit,
+        before=(before, before_id) if before is not None else None,
     )
-    return MessageListResponse(
-        total=total,
-        items=[MessageRead.model_validate(m) for m in messages],
+    return ORJSONUTCResponse(
+        {"total": total, "items": [MessageRead.orm_dict(m) for m in messages]}
     )
@@ -7,20 +7,21 @@ POST /create-tenant  — Public endpoint to onboard a new company/tenant.
 GET  /tenants/{tenant_id}/users — Admin-only: list users in a tenant.
 """
 
-from typing import Annotated
+import uuid
+from typing import Annotated, Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import ORJSONRoute, ORJSONUTCResponse
 from app.db.session import get_db
-from app.dependencies import get_current_admin
-from app.models.user import User
+from app.dependencies import require_admin_token
 from app.schemas.tenant import TenantCreate, TenantRead
 from app.schemas.user import UserRead
 from app.services.tenant_service import TenantService
 from app.services.user_service import UserService
 
-router = APIRouter(tags=["Tenants"])
+router = APIRouter(tags=["Tenants"], route_class=ORJSONRoute)
 
 
 @router.post(
@@ -40,30 +41,33 @@ async def create_tenant(
     """
     try:
         tenant = await TenantService.create_tenant(db, body)
-        return TenantRead.model_validate(tenant)
+        return TenantRead.from_orm_fast(tenant)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
 
 
 @router.get(
     "/tenants/{tenant_id}/users",
-    response_model=list[UserRead],
+    # Hot path: skip response_model re-validation (see main.py)
+    response_model=None,
+    response_class=ORJSONUTCResponse,
+    responses={200: {"model": list[UserRead]}},
     summary="List all users in a tenant (admin only)",
 )
 async def list_tenant_users(
-    tenant_id: str,
+    tenant_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    admin: Annotated[User, Depends(get_current_admin)],
-) -> list[UserRead]:
+    admin: Annotated[Dict[str, Any], Depends(require_admin_token)],
+) -> ORJSONUTCResponse:
     """
-    Admin-only.
+    Admin-only (role checked from the JWT, no user lookup).
     An admin can only list users within their own tenant — they cannot
     query other tenants even if they know the tenant_id.
     """
-    if admin.tenant_id != tenant_id:
+    if admin["tenant_id"] != str(tenant_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You can only view users within your own tenant",
         )
     users = await UserService.list_users_in_tenant(db, tenant_id)
-    return [UserRead.model_validate(u) for u in users]
+    return ORJSONUTCResponse([UserRead.orm_dict(u) for u in users])
@@ -0,0 +1,47 @@
+"""
+api/routing.py
+--------------
+Custom request/route/response classes shared by all routers.
+
+ORJSONRoute swaps Starlette's stdlib-json body parsing for orjson.
+ORJSONUTCResponse is FastAPI's ORJSONResponse with UTC datetimes written
+as "...Z" — the same form pydantic emits — so endpoints that return raw
+dicts and endpoints that go through response_model agree on the wire.
+FastAPI still validates the parsed body with pydantic; orjson's
+JSONDecodeError subclasses json.JSONDecodeError, so malformed bodies
+keep producing the usual 422 response.
+
+Usage:
+    router = APIRouter(tags=["Example"], route_class=ORJSONRoute)
+"""
+
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+
+class ORJSONRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONUTCResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+class ORJSONRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
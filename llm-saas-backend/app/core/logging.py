@@ -27,21 +27,38 @@ def configure_logging() -> None:
         logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
         logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
+    # Sub-level records are dropped by the filtering bound logger before any
+    # processor runs; keep the chain itself minimal outside of DEBUG.
     shared_processors = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
+        structlog.processors.TimeStamper(fmt="iso", utc=True, key="ts"),
     ]
 
-    renderer = (
-        structlog.dev.ConsoleRenderer()
+    if settings.DEBUG:
+        shared_processors += [
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.CallsiteParameterAdder(
+                {
+                    structlog.processors.CallsiteParameter.MODULE,
+                    structlog.processors.CallsiteParameter.LINENO,
+                }
+            ),
+        ]
+
+    # ConsoleRenderer prints exc_info itself; JSON needs it rendered to a
+    # string. default=str writes UUID ids as plain strings, not "UUID('...')".
+    renderers = (
+        [structlog.dev.ConsoleRenderer()]
         if settings.DEBUG
-        else structlog.processors.JSONRenderer()
+        else [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(default=str),
+        ]
     )
 
     structlog.configure(
-        processors=shared_processors + [renderer],
+        processors=shared_processors + renderers,
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
@@ -4,22 +4,41 @@ core/security.py
 Password hashing and JWT token utilities.
 
 Design decisions:
-  - bcrypt work factor 12 (good balance of security vs latency)
+  - bcrypt work factor from settings.BCRYPT_ROUNDS (12 in production,
+    lower in dev/test so logins don't burn ~250ms of CPU each)
   - JWT payload contains sub (user_id), tenant_id, and role for
     zero-DB-round-trip auth checks in most endpoints.
   - Tokens are signed with HS256; swap to RS256 for multi-service setups.
+  - Decoded tokens are cached briefly (keyed by SHA-256 of the token) so a
+    bearer replayed across many requests is only verified once per TTL.
 """
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.logging import get_logger
 
-# bcrypt context — rounds=12 is OWASP recommended minimum
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+logger = get_logger(__name__)
+
+# bcrypt context — rounds=12 is OWASP recommended minimum for production
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+# Resolved once at import — avoids settings lookups on every auth'd request
+_SECRET = settings.SECRET_KEY.encode()
+_ALG = settings.ALGORITHM
+_ALGS = (settings.ALGORITHM,)
+
+# Verified JWT payloads — short TTL bounds how long a cached decode is trusted
+_JWT_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=15)
 
 
 # ── Password Utilities ────────────────────────────────────────────────────────
@@ -54,7 +73,8 @@ def create_access_token(
     Returns:
         Signed JWT string.
     """
-    expire = datetime.now(timezone.utc) + (
+    now = datetime.now(timezone.utc)
+    expire = now + (
         expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     payload: Dict[str, Any] = {
@@ -62,9 +82,9 @@ def create_access_token(
         "tenant_id": tenant_id,
         "role": role,
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "iat": now,
     }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt.encode(payload, _SECRET, algorithm=_ALG)
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
@@ -77,4 +97,41 @@ def decode_access_token(token: str) -> Dict[str, Any]:
     Returns:
         Raw payload dict.
     """
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _JWT_CACHE.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        _JWT_CACHE.pop(key, None)
+
+    try:
+        payload = jwt.decode(token, _SECRET, algorithms=_ALGS)
+    except JWTError:
+        _JWT_CACHE.pop(key, None)
+        raise
+
+    if payload.get("exp", 0) <= time.time():
+        raise JWTError("Signature has expired.")
+
+    _JWT_CACHE[key] = payload
+    return payload
+
+
+# ── Startup Warm-up ───────────────────────────────────────────────────────────
+
+def warm_up() -> None:
+    """
+    Exercise bcrypt and JWT once so passlib's backend detection and jose's
+    crypto primitives load at startup rather than on the first login.
+    Bypasses the JWT cache so nothing is stored.
+
+    Also checks that hashlib's SHA-256 (used to key the JWT cache) comes
+    from OpenSSL rather than the slower builtin fallback.
+    """
+    if hashlib.sha256.__name__ != "openssl_sha256":
+        logger.warning(
+            "hashlib SHA-256 is not OpenSSL-backed; JWT cache keying will be slow",
+            impl=type(hashlib.sha256()).__module__,
+        )
+    pwd_context.verify("warm-up", pwd_context.hash("warm-up"))
+    jwt.decode(jwt.encode({"x": 1}, _SECRET, algorithm=_ALG), _SECRET, algorithms=_ALGS)
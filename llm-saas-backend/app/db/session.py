@@ -5,30 +5,83 @@ Async SQLAlchemy engine and session factory.
 
 Design decisions:
   - AsyncEngine with asyncpg driver for non-blocking I/O.
-  - Connection pool sized for typical SaaS workloads:
-      pool_size=10, max_overflow=20 → max 30 concurrent DB connections.
+  - Connection pool sized for bursty SaaS workloads (DB_POOL_* settings):
+      pool_size=20, max_overflow=40 → max 60 concurrent DB connections
+      per worker process.
+      pool_timeout=10 fails fast instead of queueing requests indefinitely.
   - pool_pre_ping=True: validates connections before checkout to handle
     stale connections after DB restarts or idle timeouts.
+  - asyncpg prepared-statement caches (512 entries) skip PARSE/DESCRIBE
+    for the handful of hot queries this app issues.
+  - Connections are tagged with application_name, open with JIT off and
+    carry connect / per-statement timeouts, so a stalled database raises
+    instead of hanging a worker (DB_JIT, DB_*_TIMEOUT settings).
+  - USE_PGBOUNCER=true: for multi-worker deployments behind PgBouncer in
+    transaction-pooling mode (DATABASE_URL pointing at port 6432). The app
+    uses NullPool so PgBouncer owns pooling, and prepared-statement caches
+    are disabled because transaction pooling cannot carry them. Statements
+    the dialect still prepares get unique names so two clients sharing a
+    server connection never collide on "__asyncpg_stmt_N__".
   - expire_on_commit=False: avoids lazy-load errors after commit in async
     context (attributes are already loaded, no implicit SELECT needed).
 """
 
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
 # ── Engine ────────────────────────────────────────────────────────────────────
+_server_settings = {"application_name": settings.APP_NAME}
+_connect_args = {
+    "timeout": settings.DB_CONNECT_TIMEOUT,
+    "command_timeout": settings.DB_COMMAND_TIMEOUT,
+    "server_settings": _server_settings,
+}
+
+# Also used by alembic/env.py when migrating through PgBouncer
+PGBOUNCER_CONNECT_ARGS = {
+    "prepared_statement_cache_size": 0,
+    "statement_cache_size": 0,
+    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+}
+
+if settings.USE_PGBOUNCER:
+    # PgBouncer rejects unknown startup parameters such as jit; set it on
+    # the role instead (ALTER ROLE ... SET jit = off).
+    _pool_kwargs = dict(
+        poolclass=NullPool,
+        connect_args={**_connect_args, **PGBOUNCER_CONNECT_ARGS},
+    )
+else:
+    _pool_kwargs = dict(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args={
+            **_connect_args,
+            "server_settings": {
+                **_server_settings,
+                "jit": "on" if settings.DB_JIT else "off",
+            },
+            "prepared_statement_cache_size": 512,  # SQLAlchemy adapter cache
+            "statement_cache_size": 512,           # asyncpg connection cache
+        },
+    )
+
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,          # Log SQL in development
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600,             # Recycle connections every hour
+    echo=settings.DB_ECHO,        # SQL logging is opt-in, separate from DEBUG
+    query_cache_size=1200,        # Compiled-statement cache (default 500)
+    **_pool_kwargs,
 )
 
 # ── Session Factory ───────────────────────────────────────────────────────────
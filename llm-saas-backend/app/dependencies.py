@@ -6,80 +6,140 @@ FastAPI dependency injection functions for authentication and authorisation.
 Flow:
   1. OAuth2PasswordBearer extracts the Bearer token from the Authorization header.
   2. decode_access_token validates and parses the JWT (no DB round-trip).
-  3. get_current_user fetches the full User record from the DB, verifying the
-     token's sub (user_id) and tenant_id against persisted data.
+  3. get_current_user fetches the User record from the DB, verifying the
+     token's sub (user_id) and tenant_id against persisted data, and returns
+     an immutable CurrentUser snapshot of it. Snapshots
+     are cached in-process for 30 seconds, so a deleted user or changed
+     role takes effect within that window.
   4. get_current_admin layers a role check on top of get_current_user.
+     require_admin_token checks the role claim alone, for admin endpoints
+     that only need the token's tenant_id and can skip the user lookup.
 
 The tenant_id embedded in the JWT is used to scope every DB query, preventing
 cross-tenant data access even if a user's role is elevated.
 """
 
-from typing import Annotated
+import uuid
+from typing import Annotated, Any, Dict
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.core.security import decode_access_token
 from app.db.session import get_db
 from app.models.user import User, UserRole
+from app.schemas.user import CurrentUser
 
 logger = get_logger(__name__)
 
 # tokenUrl must match the login endpoint path
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 
-_CREDENTIALS_EXCEPTION = HTTPException(
-    status_code=status.HTTP_401_UNAUTHORIZED,
-    detail="Could not validate credentials",
-    headers={"WWW-Authenticate": "Bearer"},
-)
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
 
 
-async def get_current_user(
+# Exceptions are built per raise: re-raising one shared instance keeps
+# appending to its __traceback__, pinning every frame and its locals.
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers=_BEARER_CHALLENGE,
+    )
+
+
+def _forbidden_admin() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Admin privileges required",
+    )
+
+
+_ADMIN_ROLE = UserRole.admin.value
+
+# Resolved users keyed by (user_id, tenant_id). Entries are immutable
+# snapshots, never ORM rows: a row stays attached to its request's session
+# and any rollback there would expire it under every later cache hit.
+_USER_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+
+async def get_token_payload(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> Dict[str, Any]:
     """
-    Decode the JWT, then load and return the full User from the database.
-    Raises 401 if the token is invalid or the user no longer exists.
+    Decode and validate the JWT without touching the database.
+    Raises 401 if the token is invalid or missing sub / tenant_id.
     """
     try:
         payload = decode_access_token(token)
-        user_id: str = payload.get("sub")
-        tenant_id: str = payload.get("tenant_id")
-        if not user_id or not tenant_id:
-            raise _CREDENTIALS_EXCEPTION
     except JWTError as exc:
         logger.warning("JWT decode failed", error=str(exc))
-        raise _CREDENTIALS_EXCEPTION
+        raise _credentials_exception()
+    if not payload.get("sub") or not payload.get("tenant_id"):
+        raise _credentials_exception()
+    return payload
 
-    # Always re-verify against DB so revoked / deleted users are rejected
-    result = await db.execute(
-        select(User).where(User.id == user_id, User.tenant_id == tenant_id)
-    )
-    user = result.scalar_one_or_none()
 
-    if user is None:
+async def _load_user(db: AsyncSession, user_id: str, tenant_id: str) -> CurrentUser:
+    # Re-verify against DB so revoked / deleted users are rejected.
+    # PK lookup goes through the identity map; tenant is checked in Python.
+    try:
+        user_uuid, tenant_uuid = uuid.UUID(user_id), uuid.UUID(tenant_id)
+    except ValueError:
+        raise _credentials_exception()
+    user = await db.get(User, user_uuid)
+
+    if user is None or user.tenant_id != tenant_uuid:
         logger.warning("User from valid JWT not found in DB", user_id=user_id)
-        raise _CREDENTIALS_EXCEPTION
+        raise _credentials_exception()
+
+    current = CurrentUser.from_orm(user)
+    _USER_CACHE[(user_id, tenant_id)] = current
+    return current
+
+
+async def get_current_user(
+    payload: Annotated[Dict[str, Any], Depends(get_token_payload)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> CurrentUser:
+    """
+    Return the user for the token, served from a short-lived cache when
+    possible. Raises 401 if the token is invalid or the user no longer
+    exists.
+    """
+    user_id, tenant_id = payload["sub"], payload["tenant_id"]
+    user = _USER_CACHE.get((user_id, tenant_id))
+    if user is not None:
+        return user
+    return await _load_user(db, user_id, tenant_id)
 
-    return user
+
+async def require_admin_token(
+    payload: Annotated[Dict[str, Any], Depends(get_token_payload)],
+) -> Dict[str, Any]:
+    """
+    Admin role check from the JWT claims alone (no DB query).
+    Raises 403 if the token's role is not admin.
+    """
+    if payload.get("role") != _ADMIN_ROLE:
+        raise _forbidden_admin()
+    return payload
 
 
 async def get_current_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    _: Annotated[Dict[str, Any], Depends(require_admin_token)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+) -> CurrentUser:
     """
     Extends get_current_user with an admin role check.
+    Non-admin tokens are rejected before any DB query runs; the persisted
+    role is then re-checked in case it changed since the token was issued.
     Raises 403 if the authenticated user is not an admin.
     """
-    if current_user.role != UserRole.admin.value:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin privileges required",
-        )
+    if current_user.role != _ADMIN_ROLE:
+        raise _forbidden_admin()
     return current_user
@@ -6,37 +6,42 @@ LLM message log model.
 Stores both the user's prompt and the AI's response alongside identifiers
 for full auditability. tenant_id is denormalised here (it could be derived
 via user.tenant_id) to allow efficient tenant-scoped queries without a JOIN.
+
+ix_messages_tenant_created_id (tenant_id, created_at DESC, id DESC) serves
+the paginated list query — including its (created_at, id) keyset cursor —
+as an index range scan with no sort, and also covers plain tenant_id
+equality lookups.
 """
 
 import uuid
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, TimestampMixin, generate_uuid7
 
 
 class Message(Base, TimestampMixin):
     __tablename__ = "messages"
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=generate_uuid7
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
     response: Mapped[str] = mapped_column(Text, nullable=False)
 
-    user_id: Mapped[str] = mapped_column(
-        String(36),
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     # Denormalised for zero-JOIN tenant-scoped queries
-    tenant_id: Mapped[str] = mapped_column(
-        String(36),
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Relationships
@@ -45,3 +50,11 @@ class Message(Base, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Message id={self.id} user_id={self.user_id}>"
+
+
+Index(
+    "ix_messages_tenant_created_id",
+    Message.tenant_id,
+    Message.created_at.desc(),
+    Message.id.desc(),
+)
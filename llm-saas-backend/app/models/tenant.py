@@ -11,16 +11,17 @@ filtering alone; always include tenant_id in WHERE clauses.
 import uuid
 
 from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, TimestampMixin, generate_uuid7
 
 
 class Tenant(Base, TimestampMixin):
     __tablename__ = "tenants"
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=generate_uuid7
     )
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
 
@@ -14,10 +14,11 @@ never stored and never logged.
 import uuid
 from enum import Enum as PyEnum
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, TimestampMixin
+from app.db.base import Base, TimestampMixin, generate_uuid7
 
 
 class UserRole(str, PyEnum):
@@ -28,8 +29,8 @@ class UserRole(str, PyEnum):
 class User(Base, TimestampMixin):
     __tablename__ = "users"
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=generate_uuid7
     )
     email: Mapped[str] = mapped_column(
         String(320), unique=True, nullable=False, index=True
@@ -38,8 +39,8 @@ class User(Base, TimestampMixin):
     role: Mapped[str] = mapped_column(
         String(20), nullable=False, default=UserRole.user.value
     )
-    tenant_id: Mapped[str] = mapped_column(
-        String(36),
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -53,3 +54,7 @@ class User(Base, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<User id={self.id} email={self.email} role={self.role}>"
+
+
+# Case-insensitive uniqueness; writes are already lowercased by the schemas.
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
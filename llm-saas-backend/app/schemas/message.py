@@ -4,9 +4,12 @@ schemas/message.py
 Pydantic models for LLM message exchange.
 """
 
+import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.message import Message
 
 
 class MessageCreate(BaseModel):
@@ -20,16 +23,40 @@ class MessageCreate(BaseModel):
 
 
 class MessageRead(BaseModel):
-    id: str
+    id: uuid.UUID
     content: str
     response: str
-    user_id: str
-    tenant_id: str
+    user_id: uuid.UUID
+    tenant_id: uuid.UUID
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_orm_fast(cls, message: Message) -> "MessageRead":
+        """Build without validation — trusted DB data only."""
+        return cls.model_construct(
+            id=message.id,
+            content=message.content,
+            response=message.response,
+            user_id=message.user_id,
+            tenant_id=message.tenant_id,
+            created_at=message.created_at,
+        )
+
+    @staticmethod
+    def orm_dict(message: Message) -> dict:
+        """Plain dict in this schema's shape, for handlers returning ORJSONUTCResponse."""
+        return {
+            "id": message.id,
+            "content": message.content,
+            "response": message.response,
+            "user_id": message.user_id,
+            "tenant_id": message.tenant_id,
+            "created_at": message.created_at,
+        }
 
 
 class MessageListResponse(BaseModel):
-    total: int
+    total: int | None  # None when paginating by cursor
     items: list[MessageRead]
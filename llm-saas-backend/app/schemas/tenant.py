@@ -8,9 +8,12 @@ Naming convention:
   TenantRead    → outbound response body (never exposes internal fields)
 """
 
+import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.models.tenant import Tenant
 
 
 class TenantCreate(BaseModel):
@@ -29,8 +32,15 @@ class TenantCreate(BaseModel):
 
 
 class TenantRead(BaseModel):
-    id: str
+    id: uuid.UUID
     name: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_orm_fast(cls, tenant: Tenant) -> "TenantRead":
+        """Build without validation — trusted DB data only."""
+        return cls.model_construct(
+            id=tenant.id, name=tenant.name, created_at=tenant.created_at
+        )
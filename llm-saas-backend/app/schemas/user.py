@@ -6,42 +6,116 @@ Pydantic models for User registration, login, and responses.
 Security note:
   - hashed_password is NEVER included in any response schema.
   - Passwords require min 8 chars; enforce stronger rules in production.
+  - Emails get a cheap shape check only (no DNS / IDNA); ownership is
+    proven by verification, not by parsing.
+  - Emails are stripped and lowercased here, once; services and the DB
+    only ever see the normalised form.
 """
 
+import re
+import uuid
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
-from app.models.user import UserRole
+from app.models.user import User, UserRole
+
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def normalize_email(v: str) -> str:
+    return v.strip().lower()
+
+
+def _fast_email_check(v: str) -> str:
+    if not _EMAIL_RE.match(v):
+        raise ValueError("value is not a valid email address")
+    return v
+
+
+Email = Annotated[
+    str,
+    Field(max_length=320),
+    AfterValidator(normalize_email),
+    AfterValidator(_fast_email_check),
+]
 
 
 class UserCreate(BaseModel):
     """Used by admin to create a new user within their tenant."""
-    email: EmailStr
+    email: Email
     password: str = Field(..., min_length=8, max_length=128)
     role: UserRole = UserRole.user
 
 
 class UserRegister(BaseModel):
     """Self-registration endpoint — tenant_id comes from request body."""
-    email: EmailStr
+    email: Email
     password: str = Field(..., min_length=8, max_length=128)
-    tenant_id: str = Field(..., description="UUID of the tenant to join")
+    tenant_id: uuid.UUID = Field(..., description="UUID of the tenant to join")
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    """
+    Immutable snapshot of the authenticated user. Safe to cache and share
+    across requests — unlike the ORM row, it is bound to no session, so a
+    rollback elsewhere can never expire it.
+    """
+    id: uuid.UUID
+    email: str
+    role: str
+    tenant_id: uuid.UUID
+    created_at: datetime
+
+    @classmethod
+    def from_orm(cls, user: User) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            tenant_id=user.tenant_id,
+            created_at=user.created_at,
+        )
 
 
 class UserRead(BaseModel):
-    id: str
+    id: uuid.UUID
     email: str
     role: str
-    tenant_id: str
+    tenant_id: uuid.UUID
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_orm_fast(cls, user: User | CurrentUser) -> "UserRead":
+        """Build without validation — trusted DB data only."""
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            tenant_id=user.tenant_id,
+            created_at=user.created_at,
+        )
+
+    @staticmethod
+    def orm_dict(user: User) -> dict:
+        """Plain dict in this schema's shape, for handlers returning ORJSONUTCResponse."""
+        return {
+            "id": user.id,
+            "email": user.email,
+            "role": user.role,
+            "tenant_id": user.tenant_id,
+            "created_at": user.created_at,
+        }
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
 
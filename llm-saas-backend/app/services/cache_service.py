@@ -0,0 +1,119 @@
+"""
+services/cache_service.py
+-------------------------
+Redis-backed caches.
+
+What this caches:
+  - LLM responses for exact prompt matches, keyed per tenant so cached
+    responses never cross tenant boundaries:
+        llm:{tenant_id}:{model}:{sha256(prompt)}
+    where model is "mock" for canned responses, so they are never served
+    once a real provider is configured. Entries expire after
+    LLM_CACHE_TTL_SECONDS.
+  - Login emails with no matching account (negative cache), so floods of
+    guesses against unknown emails skip Postgres:
+        auth:neg:{sha256(email)}
+    Entries expire after 60 seconds and are cleared on registration.
+
+Caching is best-effort: if redis isn't installed, REDIS_URL is unset, or
+Redis is unreachable, lookups behave as misses and stores are dropped.
+"""
+
+import hashlib
+from typing import Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_client = None
+
+_AUTH_NEG_TTL_SECONDS = 60
+
+
+def _get_redis():
+    """
+    Lazily create the shared async Redis client.
+    Returns the client or None if caching is unavailable.
+    """
+    global _client
+    if _client is not None or not settings.REDIS_URL:
+        return _client
+    try:
+        import redis.asyncio as redis
+    except ImportError:
+        logger.warning("redis not installed — LLM cache disabled. Run: pip install redis")
+        return None
+    _client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _client
+
+
+def _cache_key(tenant_id: str, model: str, prompt: str) -> str:
+    digest = hashlib.sha256(prompt.encode()).hexdigest()
+    return f"llm:{tenant_id}:{model}:{digest}"
+
+
+async def lookup(tenant_id: str, model: str, prompt: str) -> Optional[str]:
+    """Return the cached response for this tenant + model + prompt, or None."""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(_cache_key(tenant_id, model, prompt))
+    except Exception as exc:
+        logger.warning("LLM cache lookup failed (non-fatal)", error=str(exc))
+        return None
+
+
+async def store(tenant_id: str, model: str, prompt: str, response: str) -> None:
+    """Cache a generated response for this tenant + model + prompt."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(
+            _cache_key(tenant_id, model, prompt),
+            response,
+            ex=settings.LLM_CACHE_TTL_SECONDS,
+        )
+    except Exception as exc:
+        logger.warning("LLM cache store failed (non-fatal)", error=str(exc))
+
+
+def _auth_neg_key(email: str) -> str:
+    return f"auth:neg:{hashlib.sha256(email.encode()).hexdigest()}"
+
+
+async def is_unknown_email(email: str) -> bool:
+    """True if a recent login found no account for this email."""
+    client = _get_redis()
+    if client is None:
+        return False
+    try:
+        return bool(await client.exists(_auth_neg_key(email)))
+    except Exception as exc:
+        logger.warning("Auth cache lookup failed (non-fatal)", error=str(exc))
+        return False
+
+
+async def mark_unknown_email(email: str) -> None:
+    """Remember that no account exists for this email."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(_auth_neg_key(email), 1, ex=_AUTH_NEG_TTL_SECONDS)
+    except Exception as exc:
+        logger.warning("Auth cache store failed (non-fatal)", error=str(exc))
+
+
+async def clear_unknown_email(email: str) -> None:
+    """Forget a negative entry — call when an account is created."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.delete(_auth_neg_key(email))
+    except Exception as exc:
+        logger.warning("Auth cache clear failed (non-fatal)", error=str(exc))
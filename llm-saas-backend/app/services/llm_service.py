@@ -4,8 +4,9 @@ services/llm_service.py
 LLM abstraction layer with MLflow experiment tracking.
 
 Every inference is:
-  1. Executed (mock or real OpenAI)
-  2. Tracked in MLflow (latency, token estimates, tenant/user context)
+  1. Looked up in the per-tenant response cache (non-streaming only)
+  2. Executed (mock or real OpenAI) on a cache miss, then cached
+  3. Tracked in MLflow (latency, token estimates, tenant/user context)
 
 To view tracked runs:
   mlflow ui --port 5001
@@ -14,24 +15,49 @@ To view tracked runs:
 
 import asyncio
 import time
+from functools import cached_property, lru_cache
 from typing import AsyncGenerator
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.services import cache_service
+from app.services.mlflow_service import track_llm_call_background
 
 logger = get_logger(__name__)
 
+# Pre-encoded SSE framing — StreamingResponse sends bytes without re-encoding
+_SSE_DATA = b"data: "
+_SSE_SEP = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
 
 class LLMService:
 
+    # Fixed mock-stream tokens, built once; only the prompt echo varies per call
+    _MOCK_PREFIX: tuple[str, ...] = ("[MOCK", " STREAM]\n\n", "You", " asked:")
+    _MOCK_SUFFIX: tuple[str, ...] = (
+        "Streaming", " response", " token", " by", " token.",
+        " This", " simulates", " real", " LLM", " streaming.",
+        " Set", " OPENAI_API_KEY", " in", " .env", " for", " live", " tokens.",
+    )
+
     def __init__(self) -> None:
         self._use_mock = not bool(settings.OPENAI_API_KEY)
-        if not self._use_mock:
-            import openai
-            self._client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-        else:
+        # Cache namespace: mock output must never be served as a real model's
+        self._cache_model = "mock" if self._use_mock else settings.LLM_MODEL
+        self._mock_token_delay = settings.MOCK_TOKEN_DELAY_S
+        if self._use_mock:
             logger.info("LLMService in MOCK mode — set OPENAI_API_KEY for real LLM")
 
+    @cached_property
+    def _client(self):
+        """
+        OpenAI client, built on first real LLM call so workers that never
+        serve /messages don't pay for its HTTP pool and TLS context.
+        """
+        import openai
+        return openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
     # ── Standard (non-streaming) generate ────────────────────────────────────
 
     async def generate(
@@ -42,8 +68,14 @@ class LLMService:
     ) -> str:
         """
         Generate a full response for the given prompt.
-        Automatically tracks the call in MLflow.
+        Served from the tenant's response cache when possible; otherwise
+        generated, cached, and tracked in MLflow.
         """
+        cached = await cache_service.lookup(tenant_id, self._cache_model, prompt)
+        if cached is not None:
+            logger.info("LLM cache hit", tenant_id=tenant_id)
+            return cached
+
         start = time.monotonic()
 
         if self._use_mock:
@@ -54,9 +86,10 @@ class LLMService:
         latency_ms = round((time.monotonic() - start) * 1000, 1)
         logger.info("LLM response generated", latency_ms=latency_ms, mock=self._use_mock)
 
-        # Track in MLflow (non-blocking, never raises)
-        from app.services.mlflow_service import track_llm_call
-        track_llm_call(
+        await cache_service.store(tenant_id, self._cache_model, prompt, response)
+
+        # Track in MLflow off the request path (never raises)
+        track_llm_call_background(
             prompt=prompt,
             response=response,
             latency_ms=latency_ms,
@@ -74,43 +107,39 @@ class LLMService:
         prompt: str,
         tenant_id: str = "unknown",
         user_id: str = "unknown",
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Stream the response token by token.
 
         Yields:
-            Server-Sent Event formatted strings:  data: <token>\n\n
-            Final message:                        data: [DONE]\n\n
+            Server-Sent Event frames as UTF-8 bytes:  data: <token>\n\n
+            Final message:                            data: [DONE]\n\n
 
         Usage in route:
             return StreamingResponse(
-                llm_service.generate_stream(prompt),
+                get_llm_service().generate_stream(prompt),
                 media_type="text/event-stream"
             )
         """
         start = time.monotonic()
-        full_response = []
+        full_response = bytearray()
 
-        if self._use_mock:
-            async for token in self._mock_stream(prompt):
-                full_response.append(token)
-                yield f"data: {token}\n\n"
-        else:
-            async for token in self._openai_stream(prompt):
-                full_response.append(token)
-                yield f"data: {token}\n\n"
+        tokens = self._mock_stream(prompt) if self._use_mock else self._openai_stream(prompt)
+        async for token in tokens:
+            encoded = token.encode("utf-8")
+            full_response += encoded
+            yield _SSE_DATA + encoded + _SSE_SEP
 
         # Signal end of stream (standard SSE convention)
-        yield "data: [DONE]\n\n"
+        yield _SSE_DONE
 
         latency_ms = round((time.monotonic() - start) * 1000, 1)
-        complete_response = "".join(full_response)
+        complete_response = full_response.decode("utf-8")
 
         logger.info("LLM stream completed", latency_ms=latency_ms, mock=self._use_mock)
 
-        # Track completed stream in MLflow
-        from app.services.mlflow_service import track_llm_call
-        track_llm_call(
+        # Track completed stream in MLflow off the request path
+        track_llm_call_background(
             prompt=prompt,
             response=complete_response,
             latency_ms=latency_ms,
@@ -129,17 +158,32 @@ class LLMService:
         )
 
     async def _mock_stream(self, prompt: str) -> AsyncGenerator[str, None]:
-        """Simulates token-by-token streaming with realistic delays."""
-        tokens = [
-            "[MOCK", " STREAM]\n\n",
-            "You", " asked:", f" '{prompt[:60]}'\n\n",
-            "Streaming", " response", " token", " by", " token.",
-            " This", " simulates", " real", " LLM", " streaming.",
-            " Set", " OPENAI_API_KEY", " in", " .env", " for", " live", " tokens.",
-        ]
-        for token in tokens:
-            await asyncio.sleep(0.05)  # 50ms delay per token = realistic feel
-            yield token
+        """
+        Simulates token-by-token streaming with an optional per-token delay
+        (MOCK_TOKEN_DELAY_S).
+
+        All emissions are scheduled up front on the loop's timer heap and
+        delivered through a queue, so many concurrent mock streams don't
+        each run their own sleep/wake cycle per token.
+        """
+        tokens = (*self._MOCK_PREFIX, f" '{prompt[:60]}'\n\n", *self._MOCK_SUFFIX)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        delay = self._mock_token_delay
+        if delay:
+            handles = [
+                loop.call_later(delay * (i + 1), queue.put_nowait, token)
+                for i, token in enumerate(tokens)
+            ]
+        else:
+            # call_soon keeps FIFO order; equal call_later deadlines may not
+            handles = [loop.call_soon(queue.put_nowait, token) for token in tokens]
+        try:
+            for _ in tokens:
+                yield await queue.get()
+        finally:
+            for handle in handles:
+                handle.cancel()
 
     # ── OpenAI implementations ────────────────────────────────────────────────
 
@@ -180,5 +224,11 @@ class LLMService:
             raise RuntimeError(f"LLM streaming failed: {exc}") from exc
 
 
-# Singleton — shared across all requests
-llm_service = LLMService()
+@lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    """
+    Singleton LLMService, created on first use — shared across all requests.
+    Call it directly; as a sync Depends() FastAPI would run it in the
+    threadpool on every request.
+    """
+    return LLMService()
@@ -5,16 +5,45 @@ Business logic for LLM message creation and retrieval.
 tenant_id is always enforced at query level — no cross-tenant leakage.
 """
 
-from sqlalchemy import func, select
+import uuid
+from datetime import datetime
+
+from sqlalchemy import func, lambda_stmt, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
 from app.core.logging import get_logger
 from app.models.message import Message
-from app.models.user import User
-from app.services.llm_service import llm_service
+from app.schemas.user import CurrentUser
+from app.services.llm_service import get_llm_service
 
 logger = get_logger(__name__)
 
+# Cached lambda statements: SQLAlchemy compiles each chain once and only
+# re-binds parameters (tenant_id, skip, limit, cursor) per call.
+# load_only pulls just the columns MessageRead needs; raiseload makes any
+# accidental relationship access fail loudly instead of lazy-loading per row.
+_list_msg_stmt = lambda_stmt(
+    lambda: select(Message)
+    .options(
+        load_only(
+            Message.id,
+            Message.content,
+            Message.response,
+            Message.user_id,
+            Message.tenant_id,
+            Message.created_at,
+        ),
+        raiseload("*"),
+    )
+    # id breaks created_at ties so pages and cursors are deterministic
+    .order_by(Message.created_at.desc(), Message.id.desc())
+)
+_list_msg_with_total_stmt = _list_msg_stmt + (
+    lambda s: s.add_columns(func.count().over().label("total"))
+)
+_count_msg_stmt = lambda_stmt(lambda: select(func.count()).select_from(Message))
+
 
 class MessageService:
 
@@ -22,9 +51,12 @@ class MessageService:
     async def create_message(
         db: AsyncSession,
         content: str,
-        user: User,
+        user: CurrentUser,
     ) -> Message:
-        """Call the LLM, persist the exchange, return the Message record."""
+        """
+        Call the LLM, persist the exchange, return the Message record.
+        No DB connection is held while the LLM call is in flight.
+        """
         logger.info(
             "Generating LLM response",
             user_id=user.id,
@@ -32,11 +64,17 @@ class MessageService:
             prompt_length=len(content),
         )
 
+        # Return the pooled connection (e.g. from the auth lookup) before the
+        # LLM call, which can take seconds; the INSERT below checks out a
+        # fresh one. Nothing is pending on this session at this point.
+        if db.in_transaction():
+            await db.close()
+
         # Pass tenant_id and user_id so MLflow can track per-tenant usage
-        ai_response = await llm_service.generate(
+        ai_response = await get_llm_service().generate(
             prompt=content,
-            tenant_id=user.tenant_id,
-            user_id=user.id,
+            tenant_id=str(user.tenant_id),
+            user_id=str(user.id),
         )
 
         message = Message(
@@ -55,23 +93,54 @@ class MessageService:
     @staticmethod
     async def list_messages(
         db: AsyncSession,
-        user: User,
+        user: CurrentUser,
         skip: int = 0,
         limit: int = 20,
-    ) -> tuple[int, list[Message]]:
-        """Paginated message list scoped strictly to the requesting user's tenant."""
-        base_filter = Message.tenant_id == user.tenant_id
+        before: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[int | None, list[Message]]:
+        """
+        Paginated message list scoped strictly to the requesting user's tenant.
 
-        count_result = await db.execute(
-            select(func.count()).select_from(Message).where(base_filter)
-        )
-        total = count_result.scalar_one()
-
-        result = await db.execute(
-            select(Message)
-            .where(base_filter)
-            .order_by(Message.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        return total, list(result.scalars().all())
+        Offset pages return the tenant total via COUNT(*) OVER () in the same
+        query. Passing `before` — the (created_at, id) of the last item seen —
+        switches to keyset pagination, which stays O(limit) at any depth and
+        skips the total (returned as None). The id tie-breaker keeps rows that
+        share the boundary timestamp from being skipped.
+        """
+        tenant_id = user.tenant_id
+
+        if before is not None:
+            before_at, before_id = before
+            result = await db.execute(
+                _list_msg_stmt
+                + (
+                    lambda s: s.where(
+                        Message.tenant_id == tenant_id,
+                        tuple_(Message.created_at, Message.id)
+                        < tuple_(before_at, before_id),
+                    ).limit(limit)
+                )
+            )
+            return None, list(result.scalars().all())
+
+        rows = (
+            await db.execute(
+                _list_msg_with_total_stmt
+                + (
+                    lambda s: s.where(Message.tenant_id == tenant_id)
+                    .offset(skip)
+                    .limit(limit)
+                )
+            )
+        ).all()
+        if rows:
+            return rows[0].total, [row[0] for row in rows]
+
+        # Empty page: only past the end do we need a separate count
+        total = 0
+        if skip > 0:
+            count_result = await db.execute(
+                _count_msg_stmt + (lambda s: s.where(Message.tenant_id == tenant_id))
+            )
+            total = count_result.scalar_one()
+        return total, []
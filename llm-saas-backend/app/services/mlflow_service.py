@@ -20,8 +20,9 @@ View the MLflow UI:
   Then open: http://localhost:5001
 """
 
+import asyncio
 import time
-from typing import Optional
+from typing import Optional, Set
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -31,6 +32,15 @@ logger = get_logger(__name__)
 # MLflow experiment name — all runs are grouped under this
 EXPERIMENT_NAME = "llm-saas-backend"
 
+# Resolved in setup_mlflow(); None means tracking is disabled
+_client = None
+_experiment_id: Optional[str] = None
+# mlflow.entities classes, bound in setup_mlflow() alongside _client
+_Metric = _Param = _RunTag = None
+
+# Strong refs to in-flight background tracking tasks (prevents GC mid-run)
+_pending_tasks: Set[asyncio.Task] = set()
+
 
 def _get_mlflow():
     """
@@ -59,12 +69,19 @@ def setup_mlflow() -> None:
     tracking_uri = getattr(settings, "MLFLOW_TRACKING_URI", "mlruns")
     mlflow.set_tracking_uri(tracking_uri)
 
-    # Create experiment if it doesn't exist
-    if mlflow.get_experiment_by_name(EXPERIMENT_NAME) is None:
-        mlflow.create_experiment(EXPERIMENT_NAME)
+    # Create experiment if it doesn't exist; the ID is cached for every run
+    global _client, _experiment_id, _Metric, _Param, _RunTag
+    experiment = mlflow.get_experiment_by_name(EXPERIMENT_NAME)
+    if experiment is None:
+        _experiment_id = mlflow.create_experiment(EXPERIMENT_NAME)
         logger.info("MLflow experiment created", experiment=EXPERIMENT_NAME)
+    else:
+        _experiment_id = experiment.experiment_id
 
-    mlflow.set_experiment(EXPERIMENT_NAME)
+    mlflow.set_experiment(experiment_id=_experiment_id)
+    _client = mlflow.tracking.MlflowClient(tracking_uri=tracking_uri)
+    from mlflow.entities import Metric, Param, RunTag
+    _Metric, _Param, _RunTag = Metric, Param, RunTag
     logger.info("MLflow tracking initialised", uri=tracking_uri)
 
 
@@ -90,45 +107,70 @@ def track_llm_call(
     Returns:
         The MLflow run_id string, or None if tracking failed.
     """
-    mlflow = _get_mlflow()
-    if mlflow is None:
+    if _client is None:
         return None
 
     try:
-        mlflow.set_experiment(EXPERIMENT_NAME)
-
-        with mlflow.start_run() as run:
-            # ── Parameters (inputs, don't change within a run) ────────────────
-            mlflow.log_params({
-                "model":         settings.LLM_MODEL if not mock else "mock",
-                "prompt_length": len(prompt),
-                "tenant_id":     tenant_id,
-                "user_id":       user_id,
-                "mock_mode":     mock,
-                "environment":   settings.APP_ENV,
-            })
-
-            # ── Metrics (numeric, can be tracked over time) ───────────────────
-            mlflow.log_metrics({
-                "latency_ms":       latency_ms,
-                "response_length":  len(response),
-                "prompt_length":    float(len(prompt)),
-                # Tokens are approximated at ~4 chars per token
-                "approx_tokens_in":  len(prompt) / 4,
-                "approx_tokens_out": len(response) / 4,
-            })
-
-            # ── Tags (searchable labels) ──────────────────────────────────────
-            mlflow.set_tags({
-                "tenant_id":   tenant_id,
-                "source":      "api",
-            })
-
-            run_id = run.info.run_id
-            logger.info("MLflow run logged", run_id=run_id, latency_ms=latency_ms)
-            return run_id
+        run = _client.create_run(_experiment_id)
+        run_id = run.info.run_id
+        timestamp = int(time.time() * 1000)
+
+        # ── Parameters (inputs, don't change within a run) ────────────────────
+        params = {
+            "model":         settings.LLM_MODEL if not mock else "mock",
+            "prompt_length": len(prompt),
+            "tenant_id":     tenant_id,
+            "user_id":       user_id,
+            "mock_mode":     mock,
+            "environment":   settings.APP_ENV,
+        }
+
+        # ── Metrics (numeric, can be tracked over time) ───────────────────────
+        metrics = {
+            "latency_ms":       latency_ms,
+            "response_length":  len(response),
+            "prompt_length":    float(len(prompt)),
+            # Tokens are approximated at ~4 chars per token
+            "approx_tokens_in":  len(prompt) / 4,
+            "approx_tokens_out": len(response) / 4,
+        }
+
+        # ── Tags (searchable labels) ──────────────────────────────────────────
+        tags = {
+            "tenant_id":   tenant_id,
+            "source":      "api",
+        }
+
+        # One tracking-store round-trip for params, metrics and tags
+        _client.log_batch(
+            run_id,
+            metrics=[_Metric(k, float(v), timestamp, 0) for k, v in metrics.items()],
+            params=[_Param(k, str(v)) for k, v in params.items()],
+            tags=[_RunTag(k, v) for k, v in tags.items()],
+        )
+        _client.set_terminated(run_id)
+
+        logger.info("MLflow run logged", run_id=run_id, latency_ms=latency_ms)
+        return run_id
 
     except Exception as exc:
         # Never let tracking failures break the main request
         logger.warning("MLflow tracking failed (non-fatal)", error=str(exc))
         return None
+
+
+def track_llm_call_background(**kwargs) -> None:
+    """
+    Schedule track_llm_call in a worker thread without awaiting it, so
+    tracking-store I/O never adds latency to the request.
+    Accepts the same keyword arguments as track_llm_call.
+    """
+    task = asyncio.create_task(asyncio.to_thread(track_llm_call, **kwargs))
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+
+async def flush_pending() -> None:
+    """Wait for in-flight background tracking. Called on app shutdown."""
+    if _pending_tasks:
+        await asyncio.gather(*_pending_tasks, return_exceptions=True)
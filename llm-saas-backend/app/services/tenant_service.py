@@ -10,6 +10,8 @@ Service layer is responsible for:
   - Never returning HTTP responses (that's the route's job)
 """
 
+import uuid
+
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -41,7 +43,7 @@ class TenantService:
             raise ValueError(f"Tenant '{data.name}' already exists")
 
     @staticmethod
-    async def get_tenant_by_id(db: AsyncSession, tenant_id: str) -> Tenant | None:
+    async def get_tenant_by_id(db: AsyncSession, tenant_id: uuid.UUID) -> Tenant | None:
         result = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
         return result.scalar_one_or_none()
 
@@ -4,57 +4,97 @@ services/user_service.py
 Business logic for user registration, authentication, and listing.
 
 All queries are scoped by tenant_id to enforce strict data isolation.
+bcrypt hashing/verification runs in worker threads (asyncio.to_thread) so
+it never blocks the event loop.
+
+Unknown login emails are cached in Redis (see cache_service) so guesses
+against non-existent accounts skip Postgres. Known accounts are always read
+fresh — one indexed lookup on the unique email — so role, tenant, password
+and deletion changes apply on the very next login.
 """
 
-from sqlalchemy import select
+import asyncio
+import uuid
+
+from sqlalchemy import exists, insert, lambda_stmt, literal, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.core.logging import get_logger
 from app.core.security import hash_password, verify_password
+from app.db.base import generate_uuid7
+from app.models.tenant import Tenant
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserRegister
+from app.services import cache_service
 
 logger = get_logger(__name__)
 
+# Cached lambda statement — compiled once, re-bound per tenant
+_list_users_stmt = lambda_stmt(
+    lambda: select(User).options(raiseload("*")).order_by(User.created_at)
+)
+
+
+class TenantNotFoundError(LookupError):
+    """Raised when a user is registered into a tenant that does not exist."""
+
 
 class UserService:
 
     @staticmethod
     async def register_user(db: AsyncSession, data: UserRegister) -> User:
         """
-        Self-registration: creates a 'user'-role account in the specified tenant.
-        Raises ValueError on duplicate email.
+        Self-registration in a single round-trip: the tenant existence check
+        and the INSERT are one `INSERT ... SELECT ... WHERE EXISTS` statement.
+        Raises TenantNotFoundError if the tenant does not exist and
+        ValueError on duplicate email.
         """
-        user = User(
-            email=data.email.lower(),
-            hashed_password=hash_password(data.password),
-            role=UserRole.user.value,
-            tenant_id=data.tenant_id,
+        values = {
+            "id": generate_uuid7(),
+            "email": data.email,
+            "hashed_password": await asyncio.to_thread(hash_password, data.password),
+            "role": UserRole.user.value,
+            "tenant_id": data.tenant_id,
+        }
+        stmt = (
+            insert(User)
+            .from_select(
+                list(values),
+                select(*(literal(v) for v in values.values())).where(
+                    exists().where(Tenant.id == data.tenant_id)
+                ),
+            )
+            .returning(User)
         )
-        db.add(user)
         try:
-            await db.flush()
-            await db.refresh(user)
-            logger.info("User registered", user_id=user.id, tenant_id=user.tenant_id)
-            return user
+            result = await db.execute(stmt)
+            user = result.scalar_one_or_none()
         except IntegrityError:
             await db.rollback()
             raise ValueError(f"Email '{data.email}' is already registered")
 
+        if user is None:
+            raise TenantNotFoundError(f"Tenant '{data.tenant_id}' not found")
+
+        logger.info("User registered", user_id=user.id, tenant_id=user.tenant_id)
+        await cache_service.clear_unknown_email(user.email)
+        return user
+
     @staticmethod
     async def create_user_by_admin(
         db: AsyncSession,
         data: UserCreate,
-        tenant_id: str,
+        tenant_id: uuid.UUID,
     ) -> User:
         """
         Admin-initiated user creation within their own tenant.
         Admins can assign any role.
         """
         user = User(
-            email=data.email.lower(),
-            hashed_password=hash_password(data.password),
+            email=data.email,
+            hashed_password=await asyncio.to_thread(hash_password, data.password),
             role=data.role.value,
             tenant_id=tenant_id,
         )
@@ -68,10 +108,11 @@ class UserService:
                 role=user.role,
                 tenant_id=tenant_id,
             )
-            return user
         except IntegrityError:
             await db.rollback()
             raise ValueError(f"Email '{data.email}' is already registered")
+        await cache_service.clear_unknown_email(user.email)
+        return user
 
     @staticmethod
     async def authenticate(
@@ -79,25 +120,30 @@ class UserService:
     ) -> User | None:
         """
         Verify credentials and return the User if valid, else None.
-        Email lookup is case-insensitive.
+        Expects an email already normalised by schemas.user.normalize_email.
         """
-        result = await db.execute(
-            select(User).where(User.email == email.lower())
-        )
+        if await cache_service.is_unknown_email(email):
+            return None
+        result = await db.execute(select(User).where(User.email == email))
         user = result.scalar_one_or_none()
-        if user is None or not verify_password(password, user.hashed_password):
+        if user is None:
+            await cache_service.mark_unknown_email(email)
+            return None
+
+        if not await asyncio.to_thread(verify_password, password, user.hashed_password):
             return None
         return user
 
     @staticmethod
     async def list_users_in_tenant(
-        db: AsyncSession, tenant_id: str
+        db: AsyncSession, tenant_id: uuid.UUID
     ) -> list[User]:
         """
         Return all users belonging to a given tenant.
-        Used by admin-only endpoints.
+        Used by admin-only endpoints. Relationships are not loaded; any
+        access to them raises instead of issuing one lazy SELECT per row.
         """
         result = await db.execute(
-            select(User).where(User.tenant_id == tenant_id).order_by(User.created_at)
+            _list_users_stmt + (lambda s: s.where(User.tenant_id == tenant_id))
         )
         return list(result.scalars().all())
@@ -1,14 +1,16 @@
 """
 create_tables.py
 ----------------
-One-shot script to create all database tables.
-Use this for quick setup. For production migrations, use Alembic instead.
+One-shot script to create all database tables — local development only.
+Everywhere else run `alembic upgrade head`, which applies the schema in a
+single transaction and tracks its revision.
 
 Usage:
     python create_tables.py
 """
 
 import asyncio
+import sys
 
 from sqlalchemy.ext.asyncio import create_async_engine
 
@@ -17,7 +19,7 @@ from app.models import Base  # Imports all models so metadata is populated
 
 
 async def create_all_tables() -> None:
-    engine = create_async_engine(settings.DATABASE_URL, echo=True)
+    engine = create_async_engine(settings.DATABASE_URL, echo=settings.DB_ECHO)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     await engine.dispose()
@@ -25,4 +27,9 @@ async def create_all_tables() -> None:
 
 
 if __name__ == "__main__":
+    if settings.APP_ENV != "development":
+        sys.exit(
+            f"create_tables.py is dev-only (APP_ENV={settings.APP_ENV!r}); "
+            "run `alembic upgrade head` instead."
+        )
     asyncio.run(create_all_tables())
@@ -3,38 +3,140 @@ main.py
 -------
 FastAPI application factory and entry point.
 
-Run:
-    uvicorn main:app --reload --port 8000
+Run (factory mode — each worker builds its own app after fork):
+    uvicorn main:create_application --factory --reload --port 8000
+
+Production (uvloop + httptools, workers from settings, no access log):
+    python serve.py
+
+Startup binds the port immediately; MLflow setup, crypto warm-up and the
+connection pool run in a background task. Probe /health/live for
+liveness and /health/ready for readiness (503 until that task finishes).
+
+Response policy: handlers return schema objects and FastAPI serialises them
+through response_model. High-volume list endpoints (GET /messages,
+GET /tenants/{id}/users) instead set response_model=None, build plain
+dicts from the ORM rows and return an ORJSONUTCResponse directly, skipping
+pydantic re-validation; their schema is kept in `responses=` for OpenAPI.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request, status
+import orjson
+from fastapi import Depends, FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from sqlalchemy import text
 
 from app.api.routes import admin, auth, messages, tenants
+from app.api.routing import ORJSONUTCResponse
 from app.core.config import settings
 from app.core.logging import configure_logging, get_logger
 from app.db.session import engine
+from app.dependencies import get_current_admin, get_current_user
 
 logger = get_logger(__name__)
 
+# Set once deferred startup work has finished; gates /health/ready
+_ready = asyncio.Event()
+
+# Serialised once; every unhandled error returns the same body
+_ERR_BODY = b'{"detail":"Internal server error"}'
+_HEALTH_BODY = orjson.dumps(
+    {"status": "ok", "app": settings.APP_NAME, "env": settings.APP_ENV}
+)
+
+
+async def _warm_connection() -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _warm_pool(attempts: int = 3, backoff_s: float = 1.0) -> None:
+    """
+    Open pool_size connections concurrently so early requests skip
+    connect/auth. Best-effort: retried with exponential backoff, and a pool
+    that never warms just means the first requests connect on demand.
+    """
+    # Under PgBouncer the app uses NullPool — nothing to keep, just check reachability
+    count = 1 if settings.USE_PGBOUNCER else settings.DB_POOL_SIZE
+    for attempt in range(1, attempts + 1):
+        results = await asyncio.gather(
+            *(_warm_connection() for _ in range(count)), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if not errors:
+            return
+        logger.warning(
+            "DB pool warm-up failed",
+            attempt=attempt,
+            failed=len(errors),
+            total=count,
+            exc_info=errors[0],
+        )
+        if attempt < attempts:
+            await asyncio.sleep(backoff_s * 2 ** (attempt - 1))
+
+
+async def _deferred_init() -> None:
+    """
+    Slow startup work that must not delay the port bind. Every step is
+    best-effort — the process serves requests without them — so readiness
+    is signalled once they have all been attempted.
+    """
+    try:
+        # Load bcrypt / jose internals now instead of on the first login
+        from app.core.security import warm_up
+        await asyncio.to_thread(warm_up)
+    except Exception:
+        logger.error("Crypto warm-up failed", exc_info=True)
+
+    try:
+        # Initialise MLflow experiment tracking (may hit a remote server)
+        from app.services.mlflow_service import setup_mlflow
+        await asyncio.to_thread(setup_mlflow)
+    except Exception:
+        logger.error("MLflow setup failed — tracking disabled", exc_info=True)
+
+    # Fill the connection pool before real traffic arrives
+    await _warm_pool()
+
+    _ready.set()
+    logger.info("Ready")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     configure_logging()
     logger.info("Starting up", app=settings.APP_NAME, env=settings.APP_ENV)
 
-    # Initialise MLflow experiment tracking
-    from app.services.mlflow_service import setup_mlflow
-    setup_mlflow()
+    # Thread pool behind asyncio.to_thread (password hashing, MLflow tracking)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.THREADPOOL_MAX_WORKERS)
+    )
+
+    init_task = asyncio.create_task(_deferred_init())
 
     yield
 
     logger.info("Shutting down")
-    await engine.dispose()
+    init_task.cancel()
+    # A stalled tracking server or socket close must not hold up graceful
+    # shutdown; both steps are bounded
+    from app.services.mlflow_service import flush_pending
+    try:
+        await asyncio.wait_for(flush_pending(), timeout=10)
+    except asyncio.TimeoutError:
+        logger.warning("MLflow flush timed out; dropping pending tracking")
+    try:
+        await asyncio.wait_for(engine.dispose(), timeout=10)
+    except asyncio.TimeoutError:
+        logger.warning("engine.dispose timed out")
 
 
 def create_application() -> FastAPI:
@@ -45,39 +147,79 @@ def create_application() -> FastAPI:
             "tenant isolation, LLM streaming, and MLflow tracking."
         ),
         version="1.0.0",
-        docs_url="/docs",
-        redoc_url="/redoc",
+        # Interactive docs and the schema are dev-only; each worker would
+        # otherwise build and hold the full OpenAPI dict
+        docs_url="/docs" if settings.DEBUG else None,
+        redoc_url="/redoc" if settings.DEBUG else None,
+        openapi_url="/openapi.json" if settings.DEBUG else None,
         lifespan=lifespan,
+        # orjson serialises UUIDs/datetimes natively and is several times
+        # faster than stdlib json on large list responses
+        default_response_class=ORJSONUTCResponse,
     )
 
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.ALLOWED_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # Explicit lists match the routes we serve (tenant comes from the JWT,
+        # not a header); max_age lets browsers cache preflights for a day
+        allow_methods=["GET", "POST", "OPTIONS"],
+        allow_headers=["authorization", "content-type"],
+        max_age=86400,
     )
+    # Message and user lists compress well; tiny bodies aren't worth it
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    # Added last so it runs first: bad Host headers are rejected before
+    # CORS, gzip or routing do any work
+    if settings.ALLOWED_HOSTS != ["*"]:
+        app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.ALLOWED_HOSTS)
 
     app.include_router(tenants.router)
     app.include_router(auth.router)
-    app.include_router(messages.router)
-    app.include_router(admin.router)
+    # Routers that are authenticated end to end declare it once here.
+    # FastAPI caches a dependency per request, so handlers that also take
+    # current_user / admin resolve it a single time.
+    app.include_router(messages.router, dependencies=[Depends(get_current_user)])
+    app.include_router(admin.router, dependencies=[Depends(get_current_admin)])
 
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(
         request: Request, exc: Exception
-    ) -> JSONResponse:
-        logger.error("Unhandled exception", path=request.url.path, error=str(exc))
-        return JSONResponse(
+    ) -> Response:
+        # Read path/method from the ASGI scope — request.url builds a URL object
+        # Not bound at import: bind() would freeze structlog's default config
+        # before lifespan runs configure_logging()
+        logger.error(
+            "Unhandled exception",
+            component="http",
+            path=request.scope.get("path"),
+            method=request.scope.get("method"),
+            exc_info=exc,
+        )
+        return Response(
+            content=_ERR_BODY,
+            media_type="application/json",
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"detail": "Internal server error"},
         )
 
     @app.get("/health", tags=["Health"])
-    async def health() -> dict:
-        return {"status": "ok", "app": settings.APP_NAME, "env": settings.APP_ENV}
+    async def health() -> Response:
+        return Response(content=_HEALTH_BODY, media_type="application/json")
+
+    @app.get("/health/live", tags=["Health"])
+    async def health_live() -> Response:
+        return Response(status_code=status.HTTP_200_OK)
+
+    @app.get("/health/ready", tags=["Health"])
+    async def health_ready() -> Response:
+        if not _ready.is_set():
+            return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response(status_code=status.HTTP_200_OK)
 
     return app
 
 
-app = create_application()
+# Module-level app for tools that expect `main:app` (opt-in, built at import)
+if os.environ.get("FASTAPI_EAGER"):
+    app = create_application()
@@ -0,0 +1,32 @@
+"""
+serve.py
+--------
+Production entry point: runs uvicorn with the C event loop and HTTP parser.
+
+Worker count and loop come from settings (UVICORN_WORKERS, UVICORN_LOOP).
+Uvicorn's access log is off — it formats a line per request on the hot
+path; request logging belongs in the app's structlog output. The Server
+and Date headers are left to the reverse proxy.
+
+Usage:
+    python serve.py
+"""
+
+import uvicorn
+
+from app.core.config import settings
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "main:create_application",
+        factory=True,
+        host="0.0.0.0",
+        port=8000,
+        workers=settings.UVICORN_WORKERS,
+        loop=settings.UVICORN_LOOP,
+        http="httptools",
+        access_log=False,
+        # Drop the per-response Server / Date headers; a fronting proxy adds its own
+        server_header=False,
+        date_header=False,
+    )